@@ -8,7 +8,6 @@ import (
 	"encoding/xml"
 	"errors"
 	"fmt"
-	"io"
 	urlpkg "net/url"
 	"os"
 	"path/filepath"
@@ -184,17 +183,9 @@ func (c *Client) SetCertificates(certs ...tls.Certificate) *Client {
 // SetRootCertificate adds one or more root certificates into client.
 func (c *Client) SetRootCertificate(path string) *Client {
 	cleanPath := filepath.Clean(path)
-	file, err := os.Open(cleanPath)
-	if err != nil {
-		c.logger.Panicf(literal_0826, err)
-	}
-	defer func() {
-		if err := file.Close(); err != nil {
-			c.logger.Panicf("client: failed to close file: %v", err)
-		}
-	}()
-
-	pem, err := io.ReadAll(file)
+	// read the whole certificate in one go instead of growing
+	// a buffer chunk by chunk via open/read-all
+	pem, err := os.ReadFile(cleanPath)
 	if err != nil {
 		c.logger.Panicf(literal_0826, err)
 	}
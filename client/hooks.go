@@ -1,24 +1,22 @@
 package client
 
 import (
-	"errors"
 	"fmt"
 	"io"
 	"math/rand"
 	"mime/multipart"
 	"os"
 	"path/filepath"
-	"regexp"
 	"strconv"
 	"strings"
-	"time"
 
 	"github.com/gofiber/utils/v2"
 	"github.com/valyala/fasthttp"
 )
 
 var (
-	protocolCheck = regexp.MustCompile(`^https?://.*$`)
+	httpSchemePrefix  = "http://"
+	httpsSchemePrefix = "https://"
 
 	headerAccept = "Accept"
 
@@ -37,11 +35,12 @@ var (
 func randString(n int) string {
 	b := make([]byte, n)
 	length := len(letterBytes)
-	src := rand.NewSource(time.Now().UnixNano())
 
-	for i, cache, remain := n-1, src.Int63(), letterIdxMax; i >= 0; {
+	// use the package level source instead of seeding a new one per call,
+	// it is goroutine safe and saves the source allocation
+	for i, cache, remain := n-1, rand.Int63(), letterIdxMax; i >= 0; {
 		if remain == 0 {
-			cache, remain = src.Int63(), letterIdxMax
+			cache, remain = rand.Int63(), letterIdxMax
 		}
 
 		if idx := int(cache & int64(letterIdxMask)); idx < length {
@@ -55,6 +54,12 @@ func randString(n int) string {
 	return utils.UnsafeString(b)
 }
 
+// hasProtocolPrefix reports whether the url starts with the http or https scheme,
+// it is a cheaper replacement for a `^https?://` regexp match on the hot path.
+func hasProtocolPrefix(url string) bool {
+	return strings.HasPrefix(url, httpSchemePrefix) || strings.HasPrefix(url, httpsSchemePrefix)
+}
+
 // parserRequestURL will set the options for the hostclient
 // and normalize the url.
 // The baseUrl will be merge with request uri.
@@ -67,9 +72,9 @@ func parserRequestURL(c *Client, req *Request) error {
 	// Determine whether to superimpose baseurl based on
 	// whether the URL starts with the protocol
 	uri := splitURL[0]
-	if !protocolCheck.MatchString(uri) {
+	if !hasProtocolPrefix(uri) {
 		uri = c.baseURL + uri
-		if !protocolCheck.MatchString(uri) {
+		if !hasProtocolPrefix(uri) {
 			return ErrURLFormat
 		}
 	}
@@ -233,7 +238,6 @@ func parserRequestBodyFile(req *Request) error { //NOSONAR
 	}
 
 	// add file
-	b := make([]byte, 512)
 	for i, v := range req.files {
 		if v.name == "" && v.path == "" {
 			return ErrFileNoName
@@ -264,20 +268,10 @@ func parserRequestBodyFile(req *Request) error { //NOSONAR
 			return fmt.Errorf("create file error: %w", err)
 		}
 
-		for {
-			n, err := v.reader.Read(b)
-			if err != nil && !errors.Is(err, io.EOF) {
-				return fmt.Errorf("read file error: %w", err)
-			}
-
-			if errors.Is(err, io.EOF) {
-				break
-			}
-
-			_, err = w.Write(b[:n])
-			if err != nil {
-				return fmt.Errorf("write file error: %w", err)
-			}
+		// copy with io.Copy and its large internal buffer instead of
+		// shuffling the file through a 512 byte scratch slice
+		if _, err := io.Copy(w, v.reader); err != nil {
+			return fmt.Errorf("copy file error: %w", err)
 		}
 
 		err = v.reader.Close()
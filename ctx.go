@@ -156,8 +156,7 @@ func (c *DefaultCtx) Append(field string, values ...string) {
 	for _, value := range values {
 		if len(h) == 0 {
 			h = value
-		} else if h != value && !strings.HasPrefix(h, value+",") && !strings.HasSuffix(h, " "+value) &&
-			!strings.Contains(h, " "+value+",") {
+		} else if !headerValueContains(h, value) {
 			h += ", " + value
 		}
 	}
@@ -166,6 +165,34 @@ func (c *DefaultCtx) Append(field string, values ...string) {
 	}
 }
 
+// headerValueContains reports whether the comma separated header value h already
+// lists value, either as the only entry, the leading "value,", the trailing
+// " value" or a middle " value," part. It performs the checks in place instead
+// of building the temporary value+","-style search strings for every value.
+func headerValueContains(h, value string) bool {
+	if h == value {
+		return true
+	}
+	if len(h) <= len(value) {
+		return false
+	}
+	// leading "value,"
+	if h[len(value)] == ',' && h[:len(value)] == value {
+		return true
+	}
+	// trailing " value"
+	if h[len(h)-len(value)-1] == ' ' && h[len(h)-len(value):] == value {
+		return true
+	}
+	// middle " value,"
+	for i := 1; i+len(value) < len(h); i++ {
+		if h[i-1] == ' ' && h[i+len(value)] == ',' && h[i:i+len(value)] == value {
+			return true
+		}
+	}
+	return false
+}
+
 // Attachment sets the HTTP response Content-Disposition header field to attachment.
 func (c *DefaultCtx) Attachment(filename ...string) {
 	if len(filename) > 0 {
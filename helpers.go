@@ -323,22 +323,27 @@ func getSplicedStrList(headerValue string, dst []string) []string {
 		return nil
 	}
 
-	var (
-		index             int
-		character         rune
-		lastElementEndsAt uint8
-		insertIndex       int
-	)
-	for index, character = range headerValue + "$" {
-		if character == ',' || index == len(headerValue) {
-			if insertIndex >= len(dst) {
-				oldSlice := dst
-				dst = make([]string, len(dst)+(len(dst)>>1)+2)
-				copy(dst, oldSlice)
-			}
-			dst[insertIndex] = strings.TrimLeft(headerValue[lastElementEndsAt:index], " ")
-			lastElementEndsAt = uint8(index + 1)
-			insertIndex++
+	var insertIndex int
+	for {
+		commaPos := strings.IndexByte(headerValue, ',')
+		isLastElement := commaPos == -1
+
+		element := headerValue
+		if !isLastElement {
+			element = headerValue[:commaPos]
+			headerValue = headerValue[commaPos+1:]
+		}
+
+		if insertIndex >= len(dst) {
+			oldSlice := dst
+			dst = make([]string, len(dst)+(len(dst)>>1)+2)
+			copy(dst, oldSlice)
+		}
+		dst[insertIndex] = strings.TrimLeft(element, " ")
+		insertIndex++
+
+		if isLastElement {
+			break
 		}
 	}
 
@@ -539,11 +544,17 @@ func sortAcceptedTypes(acceptedTypes *[]acceptedType) {
 }
 
 func matchEtag(s, etag string) bool {
-	if s == etag || s == "W/"+etag || "W/"+s == etag {
+	const weakPrefix = "W/"
+
+	if s == etag {
+		return true
+	}
+	// compare the weak forms without building "W/"+... strings for every candidate
+	if strings.HasPrefix(s, weakPrefix) && s[len(weakPrefix):] == etag {
 		return true
 	}
 
-	return false
+	return strings.HasPrefix(etag, weakPrefix) && etag[len(weakPrefix):] == s
 }
 
 func (app *App) isEtagStale(etag string, noneMatchBytes []byte) bool {
@@ -699,12 +710,9 @@ func IsMethodIdempotent(m string) bool {
 }
 
 func IndexRune(str string, needle int32) bool {
-	for _, b := range str {
-		if b == needle {
-			return true
-		}
-	}
-	return false
+	// strings.ContainsRune uses the assembly-backed IndexByte fast path
+	// instead of decoding every rune in the loop
+	return strings.ContainsRune(str, needle)
 }
 
 // Convert a string value to a specified type, handling errors and optional default values.
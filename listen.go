@@ -440,9 +440,14 @@ func (app *App) printRoutesMessage() {
 			newRoute.name = route.Name
 			newRoute.method = route.Method
 			newRoute.path = route.Path
+			// collect the handler names in a builder to avoid growing
+			// the string with a new allocation per handler
+			var handlers strings.Builder
 			for _, handler := range route.Handlers {
-				newRoute.handlers += runtime.FuncForPC(reflect.ValueOf(handler).Pointer()).Name() + " "
+				handlers.WriteString(runtime.FuncForPC(reflect.ValueOf(handler).Pointer()).Name())
+				handlers.WriteByte(' ')
 			}
+			newRoute.handlers = handlers.String()
 			routes = append(routes, newRoute)
 		}
 	}
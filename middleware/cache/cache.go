@@ -91,8 +91,12 @@ func New(config ...Config) fiber.Handler { //NOSONAR
 
 	// Return new handler
 	return func(c fiber.Ctx) error {
+		// Fetch the Cache-Control header once, in the common case
+		// it carries no request directives at all
+		cacheControl := c.Get(fiber.HeaderCacheControl)
+
 		// Refrain from caching
-		if hasRequestDirective(c, noStore) {
+		if hasDirective(cacheControl, noStore) {
 			return c.Next()
 		}
 
@@ -124,7 +128,7 @@ func New(config ...Config) fiber.Handler { //NOSONAR
 				_, size := heap.remove(e.heapidx)
 				storedBytes -= size
 			}
-		} else if e.exp != 0 && !hasRequestDirective(c, noCache) {
+		} else if e.exp != 0 && !hasDirective(cacheControl, noCache) {
 			// Separate body value to avoid msgp serialization
 			// We can store raw bytes with Storage 👍
 			if cfg.Storage != nil {
@@ -242,7 +246,7 @@ func New(config ...Config) fiber.Handler { //NOSONAR
 	}
 }
 
-// Check if request has directive
-func hasRequestDirective(c fiber.Ctx, directive string) bool {
-	return strings.Contains(c.Get(fiber.HeaderCacheControl), directive)
+// Check if the Cache-Control header value has the given directive
+func hasDirective(cacheControl, directive string) bool {
+	return cacheControl != "" && strings.Contains(cacheControl, directive)
 }
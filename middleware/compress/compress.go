@@ -1,8 +1,6 @@
 package compress
 
 import (
-	"fmt"
-
 	fiber "github.com/jialequ/sdk"
 	"github.com/valyala/fasthttp"
 )
@@ -14,7 +12,7 @@ func New(config ...Config) fiber.Handler {
 
 	// Setup request handlers
 	var (
-		fctx       = func(_ *fasthttp.RequestCtx) { fmt.Print("123") }
+		fctx       = func(_ *fasthttp.RequestCtx) {}
 		compressor fasthttp.RequestHandler
 	)
 
@@ -55,11 +55,11 @@ func newEnvVar(cfg Config) *EnvVar {
 			}
 		}
 	} else {
-		const numElems = 2
 		for _, envVal := range os.Environ() {
-			keyVal := strings.SplitN(envVal, "=", numElems)
-			if _, exists := cfg.ExcludeVars[keyVal[0]]; !exists {
-				vars.set(keyVal[0], keyVal[1])
+			// cut the entry in place instead of materializing a slice per variable
+			key, val, _ := strings.Cut(envVal, "=")
+			if _, exists := cfg.ExcludeVars[key]; !exists {
+				vars.set(key, val)
 			}
 		}
 	}
@@ -11,6 +11,19 @@ func New(config ...Config) fiber.Handler { //NOSONAR
 	// Init config
 	cfg := configDefault(config...)
 
+	// Pre-build the Strict-Transport-Security value, it only depends on the config
+	var hstsValue string
+	if cfg.HSTSMaxAge != 0 {
+		subdomains := ""
+		if !cfg.HSTSExcludeSubdomains {
+			subdomains = "; includeSubDomains"
+		}
+		if cfg.HSTSPreloadEnabled {
+			subdomains += "; preload"
+		}
+		hstsValue = fmt.Sprintf("max-age=%d%s", cfg.HSTSMaxAge, subdomains)
+	}
+
 	// Return middleware handler
 	return func(c fiber.Ctx) error {
 		// Next request to skip middleware
@@ -64,15 +77,8 @@ func New(config ...Config) fiber.Handler { //NOSONAR
 		}
 
 		// Handle HSTS headers
-		if c.Protocol() == "https" && cfg.HSTSMaxAge != 0 {
-			subdomains := ""
-			if !cfg.HSTSExcludeSubdomains {
-				subdomains = "; includeSubDomains"
-			}
-			if cfg.HSTSPreloadEnabled {
-				subdomains += "; preload"
-			}
-			c.Set(fiber.HeaderStrictTransportSecurity, fmt.Sprintf("max-age=%d%s", cfg.HSTSMaxAge, subdomains))
+		if hstsValue != "" && c.Protocol() == "https" {
+			c.Set(fiber.HeaderStrictTransportSecurity, hstsValue)
 		}
 
 		// Handle Content-Security-Policy headers
@@ -5,6 +5,7 @@ import (
 	"io"
 	"os"
 	"strconv"
+	"strings"
 
 	"github.com/gofiber/utils/v2"
 	fiber "github.com/jialequ/sdk"
@@ -49,15 +50,11 @@ func defaultLoggerInstance(c fiber.Ctx, data *Data, cfg Config) error { //NOSONA
 			// Helper function to append fixed-width string with padding
 			fixedWidth := func(s string, width int, rightAlign bool) {
 				if rightAlign {
-					for i := len(s); i < width; i++ {
-						buf.WriteByte(' ')
-					}
+					writePadding(buf, width-len(s))
 					buf.WriteString(s)
 				} else {
 					buf.WriteString(s)
-					for i := len(s); i < width; i++ {
-						buf.WriteByte(' ')
-					}
+					writePadding(buf, width-len(s))
 				}
 			}
 
@@ -155,6 +152,22 @@ func appendInt(output Buffer, v int) (int, error) {
 	return output.Len() - old, nil
 }
 
+// spacePadding is the reusable whitespace block used to pad fixed-width columns
+var spacePadding = []byte(strings.Repeat(" ", 32)) //nolint:gochecknoglobals // shared read-only padding
+
+// writePadding writes n spaces to buf in slices of the padding block
+// instead of writing single bytes in a loop.
+func writePadding(buf *bytebufferpool.ByteBuffer, n int) {
+	for n > 0 {
+		chunk := n
+		if chunk > len(spacePadding) {
+			chunk = len(spacePadding)
+		}
+		_, _ = buf.Write(spacePadding[:chunk]) //nolint:errcheck // Write on a ByteBuffer never fails
+		n -= chunk
+	}
+}
+
 // writeLog writes a msg to w, printing a warning to stderr if the log fails.
 func writeLog(w io.Writer, msg []byte) {
 	if _, err := w.Write(msg); err != nil {
@@ -46,11 +46,12 @@ func captureTokens(pattern *regexp.Regexp, input string) *strings.Replacer {
 	if len(input) > 1 {
 		input = strings.TrimSuffix(input, "/")
 	}
-	groups := pattern.FindAllStringSubmatch(input, -1)
+	// only the first match is used, no need to collect all of them
+	groups := pattern.FindStringSubmatch(input)
 	if groups == nil {
 		return nil
 	}
-	values := groups[0][1:]
+	values := groups[1:]
 	replace := make([]string, 2*len(values))
 	for i, v := range values {
 		j := 2 * i
@@ -39,11 +39,12 @@ func New(config ...Config) fiber.Handler {
 
 // https://github.com/labstack/echo/blob/master/middleware/rewrite.go
 func captureTokens(pattern *regexp.Regexp, input string) *strings.Replacer {
-	groups := pattern.FindAllStringSubmatch(input, -1)
+	// only the first match is used, no need to collect all of them
+	groups := pattern.FindStringSubmatch(input)
 	if groups == nil {
 		return nil
 	}
-	values := groups[0][1:]
+	values := groups[1:]
 	replace := make([]string, 2*len(values))
 	for i, v := range values {
 		j := 2 * i
@@ -10,6 +10,7 @@ import (
 	"regexp"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 	"unicode"
 
@@ -129,6 +130,10 @@ var (
 	parameterConstraintDataSeparatorChars = []byte{paramConstraintDataSeparator}
 )
 
+// routePatternMatchCache holds the parsed parsers for RoutePatternMatch,
+// so repeated checks against the same pattern skip the parsing step
+var routePatternMatchCache sync.Map // map[string]routeParser
+
 // RoutePatternMatch checks if a given path matches a Fiber route pattern.
 func RoutePatternMatch(path, pattern string, cfg ...Config) bool {
 	// See logic in (*Route).match and (*App).register
@@ -164,7 +169,13 @@ func RoutePatternMatch(path, pattern string, cfg ...Config) bool {
 		patternPretty = strings.TrimRight(patternPretty, "/")
 	}
 
-	parser := parseRoute(patternPretty)
+	var parser routeParser
+	if cached, ok := routePatternMatchCache.Load(patternPretty); ok {
+		parser = cached.(routeParser) //nolint:forcetypeassert,errcheck // We always store a routeParser in here
+	} else {
+		parser = parseRoute(patternPretty)
+		routePatternMatchCache.Store(patternPretty, parser)
+	}
 
 	if patternPretty == "/" && path == "/" {
 		return true
@@ -417,26 +428,28 @@ func isInCharset(searchChar byte, charset []byte) bool {
 
 // findNextCharsetPosition search the next char position from the charset
 func findNextCharsetPosition(search string, charset []byte) int {
-	nextPosition := -1
-	for _, char := range charset {
-		if pos := strings.IndexByte(search, char); pos != -1 && (pos < nextPosition || nextPosition == -1) {
-			nextPosition = pos
+	// scan the search string once and stop at the first charset member,
+	// instead of running a full IndexByte pass per charset char
+	for i := 0; i < len(search); i++ {
+		if isInCharset(search[i], charset) {
+			return i
 		}
 	}
 
-	return nextPosition
+	return -1
 }
 
 // findLastCharsetPosition search the last char position from the charset
 func findLastCharsetPosition(search string, charset []byte) int {
-	lastPosition := -1
-	for _, char := range charset {
-		if pos := strings.LastIndexByte(search, char); pos != -1 && (pos < lastPosition || lastPosition == -1) {
-			lastPosition = pos
+	// scan the search string backwards once and stop at the first charset member,
+	// instead of running a full LastIndexByte pass per charset char
+	for i := len(search) - 1; i >= 0; i-- {
+		if isInCharset(search[i], charset) {
+			return i
 		}
 	}
 
-	return lastPosition
+	return -1
 }
 
 // findNextCharsetPositionConstraint search the next char position from the charset
@@ -661,15 +674,19 @@ func getParamConstraintType(constraintPart string) TypeConstraint {
 	}
 }
 
+// lists of constraint types with required data parts,
+// hoisted so CheckConstraint does not rebuild them on every call
+var (
+	needOneData = []TypeConstraint{minLenConstraint, maxLenConstraint, lenConstraint, minConstraint, maxConstraint, datetimeConstraint, regexConstraint}
+	needTwoData = []TypeConstraint{betweenLenConstraint, rangeConstraint}
+)
+
 //nolint:errcheck // : Properly check _all_ errors in here, log them & immediately return
 func (c *Constraint) CheckConstraint(param string) bool { //NOSONAR
 	var err error
 	var num int
 
 	// check data exists
-	needOneData := []TypeConstraint{minLenConstraint, maxLenConstraint, lenConstraint, minConstraint, maxConstraint, datetimeConstraint, regexConstraint}
-	needTwoData := []TypeConstraint{betweenLenConstraint, rangeConstraint}
-
 	for _, data := range needOneData {
 		if c.ID == data && len(c.Data) == 0 {
 			return false
@@ -77,7 +77,7 @@ func (app *App) prefork(addr string, tlsConfig *tls.Config, cfg ListenConfig) er
 	}
 	// create variables
 	max := runtime.GOMAXPROCS(0)
-	childs := make(map[int]*exec.Cmd)
+	childs := make(map[int]*exec.Cmd, max)
 	channel := make(chan child, max)
 
 	// kill child procs when master exits
@@ -92,7 +92,7 @@ func (app *App) prefork(addr string, tlsConfig *tls.Config, cfg ListenConfig) er
 	}()
 
 	// collect child pids
-	var pids []string
+	pids := make([]string, 0, max)
 
 	// launch child procs
 	for i := 0; i < max; i++ {
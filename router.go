@@ -218,7 +218,8 @@ func (app *App) requestHandler(rctx *fasthttp.RequestCtx) {
 	defer app.ReleaseCtx(c)
 
 	// handle invalid http method directly
-	if app.methodInt(c.Method()) == -1 {
+	// the method INT is already derived once in ctx.Reset, no need to resolve it again
+	if c.getMethodINT() == -1 {
 		_ = c.SendStatus(StatusNotImplemented) //nolint:errcheck // Always return nil
 		return
 	}
@@ -294,6 +295,39 @@ func (app *App) register(methods []string, pathRaw string, group *Group, handler
 		handlers = append(handlers, handler)
 	}
 
+	// is mounted app
+	isMount := group != nil && group.app != app
+	// Cannot have an empty path
+	if pathRaw == "" {
+		pathRaw = "/"
+	}
+	// Path always start with a '/'
+	if pathRaw[0] != '/' {
+		pathRaw = "/" + pathRaw
+	}
+	// Create a stripped path in-case sensitive / trailing slashes
+	pathPretty := pathRaw
+	// Case-sensitive routing, all to lowercase
+	if !app.config.CaseSensitive {
+		pathPretty = utils.ToLower(pathPretty)
+	}
+	// Strict routing, remove trailing slashes
+	if !app.config.StrictRouting && len(pathPretty) > 1 {
+		pathPretty = strings.TrimRight(pathPretty, "/")
+	}
+	// Is path a direct wildcard?
+	isStar := pathPretty == "/*"
+	// Is path a root slash?
+	isRoot := pathPretty == "/"
+	// Parse path parameters, the parsed route is method independent
+	// so it only has to be done once per registration
+	parsedRaw := parseRoute(pathRaw, app.customConstraints...)
+	parsedPretty := parseRoute(pathPretty, app.customConstraints...)
+
+	// collect the handler count locally and publish it once after the loop,
+	// mirroring how the mount logic accumulates its counter
+	var handlersCount uint32
+
 	for _, method := range methods {
 		// Uppercase HTTP methods
 		method = utils.ToUpper(method)
@@ -301,39 +335,12 @@ func (app *App) register(methods []string, pathRaw string, group *Group, handler
 		if method != methodUse && app.methodInt(method) == -1 {
 			panic(fmt.Sprintf("add: invalid http method %s\n", method))
 		}
-		// is mounted app
-		isMount := group != nil && group.app != app
 		// A route requires atleast one ctx handler
 		if len(handlers) == 0 && !isMount {
 			panic(fmt.Sprintf("missing handler/middleware in route: %s\n", pathRaw))
 		}
-		// Cannot have an empty path
-		if pathRaw == "" {
-			pathRaw = "/"
-		}
-		// Path always start with a '/'
-		if pathRaw[0] != '/' {
-			pathRaw = "/" + pathRaw
-		}
-		// Create a stripped path in-case sensitive / trailing slashes
-		pathPretty := pathRaw
-		// Case-sensitive routing, all to lowercase
-		if !app.config.CaseSensitive {
-			pathPretty = utils.ToLower(pathPretty)
-		}
-		// Strict routing, remove trailing slashes
-		if !app.config.StrictRouting && len(pathPretty) > 1 {
-			pathPretty = strings.TrimRight(pathPretty, "/")
-		}
 		// Is layer a middleware?
 		isUse := method == methodUse
-		// Is path a direct wildcard?
-		isStar := pathPretty == "/*"
-		// Is path a root slash?
-		isRoot := pathPretty == "/"
-		// Parse path parameters
-		parsedRaw := parseRoute(pathRaw, app.customConstraints...)
-		parsedPretty := parseRoute(pathPretty, app.customConstraints...)
 
 		// Create route metadata without pointer
 		route := Route{
@@ -356,8 +363,8 @@ func (app *App) register(methods []string, pathRaw string, group *Group, handler
 			Method:   method,
 			Handlers: handlers,
 		}
-		// Increment global handler count
-		atomic.AddUint32(&app.handlersCount, uint32(len(handlers)))
+		// Increment handler count
+		handlersCount += uint32(len(handlers))
 
 		// Middleware route matches all HTTP methods
 		if isUse {
@@ -372,6 +379,9 @@ func (app *App) register(methods []string, pathRaw string, group *Group, handler
 			app.addRoute(method, &route, isMount)
 		}
 	}
+
+	// Increment global handler count
+	atomic.AddUint32(&app.handlersCount, handlersCount)
 }
 
 func (app *App) addRoute(method string, route *Route, isMounted ...bool) {